@@ -23,13 +23,27 @@ import os
 import sys
 import json
 import time
+import select
 import socket
 import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
-from urllib.parse import urlencode
+from http.client import HTTPConnection, HTTPSConnection, HTTPResponse, RemoteDisconnected
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+from urllib.parse import quote_plus, urlencode, urlsplit
+
+# orjson parses and produces bytes directly, skipping the str round trip;
+# fall back to the stdlib with the same bytes-in/bytes-out interface.
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
 # Configure logging - NO PII, aggregate metrics only
 logging.basicConfig(
@@ -51,17 +65,31 @@ CONFIG = {
     'error_rate_threshold': float(os.environ.get('ERROR_RATE_THRESHOLD', '0.1')),  # 10% error rate
 }
 
+# Fixed for the life of the process, so read once
+TELEGRAM_TOKEN = CONFIG['telegram_token']
+TELEGRAM_CHAT_ID = CONFIG['telegram_chat_id']
+SENDGRID_API_KEY = CONFIG['sendgrid_api_key']
+ALERT_EMAIL = CONFIG['alert_email']
+FROM_EMAIL = CONFIG['from_email']
+CHECK_INTERVAL = CONFIG['check_interval']
+FAILURE_THRESHOLD = CONFIG['failure_threshold']
+ERROR_RATE_THRESHOLD = CONFIG['error_rate_threshold']
+
+METRICS_URL = 'http://127.0.0.1:8393/api/metrics'
+
 # Service endpoints to monitor
 SERVICES = {
     'fresh_api': {
         'name': 'Fresh API',
-        'url': 'http://localhost:8393/api/health',
+        'url': 'http://127.0.0.1:8393/api/health',
         'expected_status': 200,
         'timeout': 10,
+        'parse_json': True,
     },
     'gate_service': {
         'name': 'Gate Service',
-        'url': 'http://localhost:8787/',
+        'url': 'http://127.0.0.1:8787/',
+        'method': 'HEAD',  # Liveness only; the page body is never inspected
         'expected_status': 200,
         'timeout': 10,
     },
@@ -70,66 +98,208 @@ SERVICES = {
         'url': 'http://10.67.0.1:7781/api/health',
         'expected_status': 200,
         'timeout': 15,
+        'parse_json': True,
         'optional': True,  # Don't alert if VPN service is down (fallback exists)
     },
     'metrics': {
         'name': 'Metrics Endpoint',
-        'url': 'http://localhost:8393/api/metrics',
+        'url': METRICS_URL,
         'expected_status': 200,
         'timeout': 10,
+        'parse_json': True,
+        'feeds_error_rate': True,  # Body is reused by check_error_rates
     },
 }
 
+# The checks are independent I/O, so each tick runs them in parallel. Bound
+# the tick by the slowest configured timeout rather than the sum of them.
+CHECK_EXECUTOR = ThreadPoolExecutor(max_workers=len(SERVICES), thread_name_prefix='health-check')
+CHECK_DEADLINE = max(cfg['timeout'] for cfg in SERVICES.values()) + 2
+
+# Adaptive polling: back off to 2x the interval once every required service has
+# held an EWMA success rate above STABLE_EWMA for STABLE_PERIOD seconds, and
+# drop to 1/4 while failures are accumulating toward the alert threshold.
+# The bounds only limit the adjustment; a configured interval outside them is
+# used as-is when nothing needs adapting.
+MIN_CHECK_INTERVAL = 5
+MAX_CHECK_INTERVAL = 300
+FAST_CHECK_INTERVAL = max(CHECK_INTERVAL / 4, min(MIN_CHECK_INTERVAL, CHECK_INTERVAL))
+SLOW_CHECK_INTERVAL = min(CHECK_INTERVAL * 2, max(MAX_CHECK_INTERVAL, CHECK_INTERVAL))
+HEALTH_EWMA_ALPHA = 0.1
+STABLE_EWMA = 0.99
+STABLE_PERIOD = 600
+
+# Minimum seconds between two alerts for the same condition, so a flapping
+# service can't turn into an alert storm
+ALERT_COOLDOWN = 600
+SEVERITY_RANK = {'info': 0, 'warning': 1, 'critical': 2}
+SEVERITY_EMOJI = {'critical': "🔴", 'warning': "⚠️", 'info': "✅"}
+
 # Track service states
-service_states: Dict[str, Dict[str, Any]] = {}
+service_states: Dict[str, Dict[str, Any]] = {
+    service_id: {
+        'consecutive_failures': 0,
+        'last_alert_time': None,
+        'alert_open': False,
+        'last_status': 'unknown',
+        'ewma': 1.0,
+        'stable_since': None,
+    }
+    for service_id in SERVICES
+}
+error_rate_state: Dict[str, Any] = {'last_alert_time': None}
+# Last metrics body and its validators; a 304 reuses the body without parsing.
+# A metrics check that overruns CHECK_DEADLINE keeps running into the next
+# tick, so two checks can overlap; the lock keeps body and validators paired.
+metrics_cache: Dict[str, Any] = {'etag': None, 'last_modified': None, 'body': None}
+metrics_cache_lock = threading.Lock()
+
+
+class HTTPPool:
+    """
+    Keep-alive HTTP(S) connections reused across requests, keyed by scheme/host/port.
+
+    The same endpoints are polled every interval forever, so reusing the socket
+    skips a TCP (and for the alert APIs, TLS) handshake per request. Safe to
+    share between threads: a connection is checked out for one request and
+    only returned once its response has been fully read.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        self.maxsize = maxsize
+        self._idle: Dict[Tuple[str, str, int], List[HTTPConnection]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def _checkout(self, key: Tuple[str, str, int], timeout: float) -> Tuple[HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle[key]
+            conn = idle.pop() if idle else None
+        if conn is None:
+            return self._connect(key, timeout), False
+        # An idle socket that is readable has been closed by the server (or has
+        # stray data); drop it here rather than find out after sending
+        if conn.sock is not None and select.select([conn.sock], [], [], 0)[0]:
+            conn.close()
+            return self._connect(key, timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    @staticmethod
+    def _connect(key: Tuple[str, str, int], timeout: float) -> HTTPConnection:
+        scheme, host, port = key
+        conn_class = HTTPSConnection if scheme == 'https' else HTTPConnection
+        return conn_class(host, port, timeout=timeout)
+
+    def _checkin(self, key: Tuple[str, str, int], conn: HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle[key]
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def request(self, method: str, url: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None, timeout: float = 10) -> Iterator[HTTPResponse]:
+        """Send a request and yield the response; raises OSError on connection failures."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+        path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+
+        conn, reused = self._checkout(key, timeout)
+        sent = False
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            sent = True
+            response = conn.getresponse()
+        except (RemoteDisconnected, ConnectionError) as exc:
+            conn.close()
+            if not reused:
+                raise
+            # Once sent, the server may have acted on the request, so only an
+            # idempotent one that got no response at all is safe to send again
+            if sent and not (isinstance(exc, RemoteDisconnected) and method in ('GET', 'HEAD')):
+                raise
+            # The server dropped an idle keep-alive connection; retry once on a fresh one
+            conn = self._connect(key, timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+        try:
+            yield response
+        finally:
+            # Only a fully read response leaves the connection ready for reuse
+            if response.isclosed() and not response.will_close:
+                self._checkin(key, conn)
+            else:
+                conn.close()
+
+
+# Health checks and outbound alerts use separate pools so alert TLS
+# connections never compete with the monitoring checks
+CHECK_POOL = HTTPPool()
+ALERT_POOL = HTTPPool()
+
+# Static parts of the alert API requests, built once
+TELEGRAM_URL = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
+TELEGRAM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+TELEGRAM_FORM_PREFIX = urlencode({'chat_id': TELEGRAM_CHAT_ID, 'parse_mode': 'HTML'}).encode('ascii') + b'&text='
+SENDGRID_URL = "https://api.sendgrid.com/v3/mail/send"
+SENDGRID_HEADERS = {
+    'Authorization': f'Bearer {SENDGRID_API_KEY}',
+    'Content-Type': 'application/json',
+}
+SENDGRID_PERSONALIZATIONS = [{"to": [{"email": ALERT_EMAIL}]}]
+SENDGRID_FROM = {"email": FROM_EMAIL, "name": "A Formulation of Truth Monitor"}
+
+# Alerts are sent off the tick thread so a slow or hung alert API can't delay
+# the next round of checks. One worker per channel keeps each channel's alerts
+# in the order they were raised.
+TELEGRAM_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='alert-telegram')
+EMAIL_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='alert-email')
 
 
 def send_telegram_alert(message: str) -> bool:
     """Send alert via Telegram bot."""
-    if not CONFIG['telegram_token'] or not CONFIG['telegram_chat_id']:
+    if not TELEGRAM_TOKEN or not TELEGRAM_CHAT_ID:
         logger.warning("Telegram credentials not configured, skipping Telegram alert")
         return False
 
     try:
-        url = f"https://api.telegram.org/bot{CONFIG['telegram_token']}/sendMessage"
-        data = urlencode({
-            'chat_id': CONFIG['telegram_chat_id'],
-            'text': message,
-            'parse_mode': 'HTML'
-        }).encode('utf-8')
-
-        req = Request(url, data=data, method='POST')
-        req.add_header('Content-Type', 'application/x-www-form-urlencoded')
-
-        with urlopen(req, timeout=10) as response:
-            result = json.loads(response.read().decode('utf-8'))
+        data = TELEGRAM_FORM_PREFIX + quote_plus(message).encode('ascii')
+
+        with ALERT_POOL.request('POST', TELEGRAM_URL, body=data, headers=TELEGRAM_HEADERS, timeout=10) as response:
+            result = json_loads(response.read())
             if result.get('ok'):
                 logger.info("Telegram alert sent successfully")
                 return True
             else:
-                logger.error(f"Telegram API error: {result}")
+                logger.error("Telegram API error: %s", result)
                 return False
     except Exception as e:
-        logger.error(f"Failed to send Telegram alert: {e}")
+        logger.error("Failed to send Telegram alert: %s", e)
         return False
 
 
 def send_email_alert(subject: str, body: str) -> bool:
     """Send alert via SendGrid API."""
-    if not CONFIG['sendgrid_api_key']:
+    if not SENDGRID_API_KEY:
         logger.warning("SendGrid API key not configured, skipping email alert")
         return False
 
     try:
-        url = "https://api.sendgrid.com/v3/mail/send"
         payload = {
-            "personalizations": [{
-                "to": [{"email": CONFIG['alert_email']}]
-            }],
-            "from": {
-                "email": CONFIG['from_email'],
-                "name": "A Formulation of Truth Monitor"
-            },
+            "personalizations": SENDGRID_PERSONALIZATIONS,
+            "from": SENDGRID_FROM,
             "subject": subject,
             "content": [{
                 "type": "text/plain",
@@ -137,39 +307,51 @@ def send_email_alert(subject: str, body: str) -> bool:
             }]
         }
 
-        data = json.dumps(payload).encode('utf-8')
-        req = Request(url, data=data, method='POST')
-        req.add_header('Authorization', f'Bearer {CONFIG["sendgrid_api_key"]}')
-        req.add_header('Content-Type', 'application/json')
+        data = json_dumps(payload)
 
-        with urlopen(req, timeout=15) as response:
+        with ALERT_POOL.request('POST', SENDGRID_URL, body=data, headers=SENDGRID_HEADERS, timeout=15) as response:
+            response_body = response.read()
             if response.status in [200, 202]:
                 logger.info("Email alert sent successfully")
                 return True
+            elif response.status >= 400:
+                logger.error("SendGrid API error: %s - %s", response.status,
+                             response_body.decode('utf-8', errors='ignore')[:200])
+                return False
             else:
-                logger.error(f"SendGrid API returned status {response.status}")
+                logger.error("SendGrid API returned status %s", response.status)
                 return False
-    except HTTPError as e:
-        logger.error(f"SendGrid API error: {e.code} - {e.read().decode('utf-8', errors='ignore')[:200]}")
-        return False
     except Exception as e:
-        logger.error(f"Failed to send email alert: {e}")
+        logger.error("Failed to send email alert: %s", e)
         return False
 
 
 def send_alert(title: str, message: str, severity: str = "warning") -> None:
-    """Send alert via all configured channels."""
+    """Queue an alert on all configured channels; returns without waiting for delivery."""
     timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
-    emoji = "🔴" if severity == "critical" else "⚠️" if severity == "warning" else "✅"
+    emoji = SEVERITY_EMOJI.get(severity, "✅")
+    # Shared by both channels; only the title line and timestamp markup differ
+    core = f"\n\n{message}\n\n"
+
+    # Telegram and email are delivered in parallel on their own workers
+    TELEGRAM_EXECUTOR.submit(send_telegram_alert, f"{emoji} <b>{title}</b>{core}<i>Timestamp: {timestamp}</i>")
+    EMAIL_EXECUTOR.submit(send_email_alert, f"[{severity.upper()}] {title}",
+                          f"{title}{core}Timestamp: {timestamp}\n\nServer: aformulationoftruth.com")
+
 
-    # Telegram message
-    telegram_msg = f"{emoji} <b>{title}</b>\n\n{message}\n\n<i>Timestamp: {timestamp}</i>"
-    send_telegram_alert(telegram_msg)
+def send_alerts(alerts: List[Tuple[str, str, str]]) -> None:
+    """Send a tick's (title, message, severity) alerts as one combined alert."""
+    if len(alerts) == 1:
+        send_alert(*alerts[0])
+    elif alerts:
+        severity = max((alert[2] for alert in alerts), key=SEVERITY_RANK.__getitem__)
+        message = "\n\n".join(f"{title}\n{body}" for title, body, _ in alerts)
+        send_alert(f"{len(alerts)} Monitoring Alerts", message, severity=severity)
 
-    # Email
-    email_subject = f"[{severity.upper()}] {title}"
-    email_body = f"{title}\n\n{message}\n\nTimestamp: {timestamp}\n\nServer: aformulationoftruth.com"
-    send_email_alert(email_subject, email_body)
+
+def cooled_down(last_alert_time: Optional[float], now: float) -> bool:
+    """True if no alert was sent for this condition within ALERT_COOLDOWN."""
+    return last_alert_time is None or now - last_alert_time >= ALERT_COOLDOWN
 
 
 def check_service(service_id: str, service_config: dict) -> Dict[str, Any]:
@@ -184,38 +366,66 @@ def check_service(service_id: str, service_config: dict) -> Dict[str, Any]:
     }
 
     try:
-        start_time = time.time()
-        req = Request(service_config['url'], method='GET')
-
-        with urlopen(req, timeout=service_config['timeout']) as response:
-            response_time = (time.time() - start_time) * 1000
+        start_time = time.monotonic()
+
+        method = service_config.get('method', 'GET')
+        is_metrics = service_config.get('feeds_error_rate', False)
+        headers = {}
+        cached_body = None
+        if is_metrics:
+            with metrics_cache_lock:
+                cached_body = metrics_cache['body']
+                if cached_body is not None and metrics_cache['etag']:
+                    headers['If-None-Match'] = metrics_cache['etag']
+                if cached_body is not None and metrics_cache['last_modified']:
+                    headers['If-Modified-Since'] = metrics_cache['last_modified']
+
+        with CHECK_POOL.request(method, service_config['url'], headers=headers,
+                                timeout=service_config['timeout']) as response:
+            response_time = (time.monotonic() - start_time) * 1000
             result['response_time_ms'] = round(response_time, 2)
 
-            if response.status == service_config['expected_status']:
+            if response.status == 304 and headers:
+                # Metrics unchanged since the last tick
+                result['status'] = 'healthy'
+                result['_body'] = cached_body
+            elif response.status == service_config['expected_status']:
                 result['status'] = 'healthy'
 
-                # For health endpoints, try to parse the response
-                if 'health' in service_config['url']:
+                # For JSON endpoints, try to parse the response
+                if service_config.get('parse_json'):
                     try:
-                        data = json.loads(response.read().decode('utf-8'))
+                        data = json_loads(response.read())
                         if data.get('status') == 'degraded':
                             result['status'] = 'degraded'
                             result['error'] = data.get('message', 'Service degraded')
+                        # Keep the metrics body so check_error_rates doesn't fetch it again
+                        if is_metrics:
+                            result['_body'] = data
+                            with metrics_cache_lock:
+                                metrics_cache.update(
+                                    body=data,
+                                    etag=response.getheader('ETag'),
+                                    last_modified=response.getheader('Last-Modified'),
+                                )
                     except:
                         pass
+            elif response.status >= 400:
+                result['status'] = 'unhealthy'
+                result['error'] = f"HTTP {response.status}"
             else:
                 result['status'] = 'unhealthy'
                 result['error'] = f"Unexpected status code: {response.status}"
 
-    except HTTPError as e:
-        result['status'] = 'unhealthy'
-        result['error'] = f"HTTP {e.code}"
-    except URLError as e:
-        result['status'] = 'down'
-        result['error'] = f"Connection failed: {e.reason}"
+            # Consume whatever body wasn't parsed above so the pool can reuse the connection
+            response.read()
+
     except socket.timeout:
         result['status'] = 'timeout'
         result['error'] = f"Timeout after {service_config['timeout']}s"
+    except OSError as e:
+        result['status'] = 'down'
+        result['error'] = f"Connection failed: {e}"
     except Exception as e:
         result['status'] = 'error'
         result['error'] = str(e)
@@ -223,8 +433,8 @@ def check_service(service_id: str, service_config: dict) -> Dict[str, Any]:
     return result
 
 
-def check_error_rates() -> Dict[str, Any]:
-    """Check error rates from metrics endpoint."""
+def check_error_rates(data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Check error rates from metrics endpoint, or from an already-fetched metrics body."""
     result = {
         'status': 'unknown',
         'error_rate_5xx': None,
@@ -233,23 +443,25 @@ def check_error_rates() -> Dict[str, Any]:
     }
 
     try:
-        req = Request('http://localhost:8393/api/metrics', method='GET')
-        with urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-
-            current = data.get('currentHour', {})
-            total_requests = current.get('requests.total', 0) + current.get('requests.api', 0)
-            errors_5xx = current.get('errors.5xx', 0)
-
-            result['total_requests'] = total_requests
-            result['error_count_5xx'] = errors_5xx
-
-            if total_requests > 0:
-                error_rate = errors_5xx / total_requests
-                result['error_rate_5xx'] = round(error_rate, 4)
-                result['status'] = 'high_errors' if error_rate > CONFIG['error_rate_threshold'] else 'normal'
-            else:
-                result['status'] = 'no_traffic'
+        if data is None:
+            with CHECK_POOL.request('GET', METRICS_URL, timeout=10) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"HTTP Error {response.status}")
+                data = json_loads(response.read())
+
+        current = data.get('currentHour', {})
+        total_requests = current.get('requests.total', 0) + current.get('requests.api', 0)
+        errors_5xx = current.get('errors.5xx', 0)
+
+        result['total_requests'] = total_requests
+        result['error_count_5xx'] = errors_5xx
+
+        if total_requests > 0:
+            error_rate = errors_5xx / total_requests
+            result['error_rate_5xx'] = round(error_rate, 4)
+            result['status'] = 'high_errors' if error_rate > ERROR_RATE_THRESHOLD else 'normal'
+        else:
+            result['status'] = 'no_traffic'
 
     except Exception as e:
         result['status'] = 'check_failed'
@@ -258,60 +470,112 @@ def check_error_rates() -> Dict[str, Any]:
     return result
 
 
-def process_health_check(service_id: str, result: Dict[str, Any], service_config: dict) -> None:
-    """Process health check result and send alerts if needed."""
-    # Initialize state tracking
-    if service_id not in service_states:
-        service_states[service_id] = {
-            'consecutive_failures': 0,
-            'last_alert_time': None,
-            'last_status': 'unknown',
-        }
-
+def process_health_check(service_id: str, result: Dict[str, Any], service_config: dict,
+                         pending_alerts: List[Tuple[str, str, str]]) -> None:
+    """Process health check result and queue alerts if needed."""
     state = service_states[service_id]
-    is_healthy = result['status'] in ['healthy']
+    is_healthy = result['status'] == 'healthy'
     is_optional = service_config.get('optional', False)
 
+    state['ewma'] += HEALTH_EWMA_ALPHA * (is_healthy - state['ewma'])
+    if state['ewma'] <= STABLE_EWMA:
+        state['stable_since'] = None
+    elif state['stable_since'] is None:
+        state['stable_since'] = time.monotonic()
+
     if is_healthy:
-        # Service recovered
-        if state['consecutive_failures'] >= CONFIG['failure_threshold']:
-            send_alert(
+        # Service recovered; only announce it if its outage was announced
+        if state['alert_open']:
+            pending_alerts.append((
                 f"Service Recovered: {result['name']}",
                 f"Service is now healthy.\nResponse time: {result['response_time_ms']}ms",
-                severity="info"
-            )
+                "info",
+            ))
+            state['alert_open'] = False
         state['consecutive_failures'] = 0
         state['last_status'] = 'healthy'
     else:
         state['consecutive_failures'] += 1
         state['last_status'] = result['status']
 
-        # Alert after threshold failures (skip optional services)
-        if state['consecutive_failures'] == CONFIG['failure_threshold'] and not is_optional:
-            send_alert(
+        # Alert after threshold failures (skip optional services). If the last
+        # alert was too recent, keep checking each tick until the cooldown ends.
+        now = time.monotonic()
+        if (state['consecutive_failures'] >= FAILURE_THRESHOLD and not is_optional
+                and not state['alert_open'] and cooled_down(state['last_alert_time'], now)):
+            pending_alerts.append((
                 f"Service Down: {result['name']}",
                 f"Status: {result['status']}\nError: {result['error']}\nConsecutive failures: {state['consecutive_failures']}",
-                severity="critical"
-            )
+                "critical",
+            ))
+            state['alert_open'] = True
+            state['last_alert_time'] = now
+
+
+def next_interval() -> float:
+    """Seconds to wait before the next tick, based on recent service stability."""
+    # Optional services never alert, so they don't speed up or hold back polling
+    states = [service_states[sid] for sid, cfg in SERVICES.items() if not cfg.get('optional', False)]
+    now = time.monotonic()
+
+    if any(0 < s['consecutive_failures'] < FAILURE_THRESHOLD for s in states):
+        return FAST_CHECK_INTERVAL
+    if all(s['stable_since'] is not None and now - s['stable_since'] >= STABLE_PERIOD for s in states):
+        return SLOW_CHECK_INTERVAL
+    return CHECK_INTERVAL
 
 
 def run_health_checks() -> None:
-    """Run all health checks."""
-    logger.info("Running health checks...")
-
-    for service_id, service_config in SERVICES.items():
-        result = check_service(service_id, service_config)
-        logger.info(f"  {result['name']}: {result['status']} ({result['response_time_ms']}ms)")
-        process_health_check(service_id, result, service_config)
-
-    # Check error rates
-    error_check = check_error_rates()
-    if error_check['status'] == 'high_errors':
-        send_alert(
+    """Run all health checks and log the outcome as one structured record."""
+    logger.debug("Running health checks...")
+
+    check_futures = {
+        service_id: CHECK_EXECUTOR.submit(check_service, service_id, service_config)
+        for service_id, service_config in SERVICES.items()
+    }
+    wait(check_futures.values(), timeout=CHECK_DEADLINE)
+    metrics_body = None
+    pending_alerts: List[Tuple[str, str, str]] = []
+    tick: Dict[str, Any] = {'ts': datetime.now(timezone.utc).isoformat(), 'services': {}}
+
+    # Results are processed on this thread, so service_states has a single writer
+    for service_id, future in check_futures.items():
+        service_config = SERVICES[service_id]
+        if future.done():
+            result = future.result()
+        else:
+            result = {
+                'service_id': service_id,
+                'name': service_config['name'],
+                'status': 'timeout',
+                'response_time_ms': None,
+                'error': f"No result after {CHECK_DEADLINE}s",
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+            }
+        metrics_body = result.pop('_body', metrics_body)
+        logger.debug("  %s: %s (%sms)", result['name'], result['status'], result['response_time_ms'])
+        tick['services'][service_id] = {
+            'status': result['status'],
+            'rt_ms': result['response_time_ms'],
+            'error': result['error'],
+        }
+        process_health_check(service_id, result, service_config, pending_alerts)
+
+    # Check error rates from the body the metrics check already fetched; if that
+    # check failed there is nothing to compute from this tick
+    error_check = check_error_rates(metrics_body) if metrics_body is not None else {'status': 'check_failed'}
+    now = time.monotonic()
+    if error_check['status'] == 'high_errors' and cooled_down(error_rate_state['last_alert_time'], now):
+        pending_alerts.append((
             "High Error Rate Detected",
             f"5xx error rate: {error_check['error_rate_5xx']*100:.1f}%\nTotal requests: {error_check['total_requests']}\n5xx errors: {error_check['error_count_5xx']}",
-            severity="warning"
-        )
+            "warning",
+        ))
+        error_rate_state['last_alert_time'] = now
+
+    tick['error_rate'] = error_check
+    logger.info("tick %s", json_dumps(tick).decode('utf-8'))
+    send_alerts(pending_alerts)
 
 
 def main():
@@ -319,22 +583,31 @@ def main():
     logger.info("=" * 50)
     logger.info("A Formulation of Truth - Health Monitor")
     logger.info("=" * 50)
-    logger.info(f"Check interval: {CONFIG['check_interval']}s")
-    logger.info(f"Failure threshold: {CONFIG['failure_threshold']} consecutive failures")
-    logger.info(f"Telegram configured: {'Yes' if CONFIG['telegram_token'] else 'No'}")
-    logger.info(f"SendGrid configured: {'Yes' if CONFIG['sendgrid_api_key'] else 'No'}")
+    logger.info("Check interval: %ss (adaptive, %g-%gs)", CHECK_INTERVAL, FAST_CHECK_INTERVAL, SLOW_CHECK_INTERVAL)
+    logger.info("Failure threshold: %s consecutive failures", FAILURE_THRESHOLD)
+    logger.info("Telegram configured: %s", 'Yes' if TELEGRAM_TOKEN else 'No')
+    logger.info("SendGrid configured: %s", 'Yes' if SENDGRID_API_KEY else 'No')
     logger.info("=" * 50)
 
-    # Initial health check
+    # Initial health check; later ticks are scheduled from this anchor rather
+    # than from when the previous tick finished, so check runtime doesn't drift
+    next_tick = time.monotonic()
     run_health_checks()
 
     # Continuous monitoring loop
     while True:
-        time.sleep(CONFIG['check_interval'])
+        interval = next_interval()
+        next_tick += interval
+        now = time.monotonic()
+        if next_tick < now:
+            skipped = int((now - next_tick) // interval) + 1
+            next_tick += skipped * interval
+            logger.warning("Health checks overran the interval; skipping %d tick(s)", skipped)
+        time.sleep(next_tick - now)
         try:
             run_health_checks()
         except Exception as e:
-            logger.error(f"Health check error: {e}")
+            logger.error("Health check error: %s", e)
 
 
 if __name__ == '__main__':
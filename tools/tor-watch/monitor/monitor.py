@@ -2,16 +2,51 @@ import hashlib
 import os
 import re
 import sqlite3
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Iterable
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Signatures are change detectors, not security boundaries, so use the faster
+# BLAKE3 when installed. Both give 64 hex chars; rows written under the other
+# algorithm simply never match, so mirrors re-detect once after a switch.
+try:
+    from blake3 import blake3 as signature_hash
+except ImportError:
+    signature_hash = hashlib.sha256
+
+# lxml is a C parser and several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+except ImportError:
+    HTML_PARSER = "html.parser"
+else:
+    HTML_PARSER = "lxml"
 
 ONION_RE = re.compile(r"[a-z2-7]{56}\.onion", re.IGNORECASE)
+ONION_HOST_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz234567")
+# An href with a scheme ("http:", "mailto:") or a network path ("//host") names its
+# own host; anything else is relative and resolves to the page's host. Like
+# urlsplit, skip leading control characters and spaces and ignore tab/CR/LF.
+ABSOLUTE_HREF_RE = re.compile(r"[\x00-\x20]*(?:[a-z][a-z0-9+.\t\n\r-]*:|/[\t\n\r]*/)", re.IGNORECASE)
+# Each onion host gets its own pool; size it so no target's kept-alive Tor
+# circuit is evicted between cycles (urllib3 defaults to 10 hosts).
+POOL_SIZE = 64
+# Upper bound on how much of a page is read and parsed; an onion index page is
+# far smaller, and this stops a huge or endless body from exhausting memory
+MAX_BODY_BYTES = 2_000_000
+# Stable pages come back byte-identical cycle after cycle; remember the analysis
+# of the most recent ones so they aren't re-parsed every time
+ANALYSIS_CACHE_SIZE = 1024
 
 
 @dataclass
@@ -22,6 +57,21 @@ class Config:
     targets_file: str = os.getenv("MONITOR_TARGETS_FILE", "/app/targets.txt")
     db_path: str = os.getenv("MONITOR_DB_PATH", "/data/monitor.db")
     follow_redirects: bool = os.getenv("MONITOR_FOLLOW_REDIRECTS", "true").lower() == "true"
+    workers: int = int(os.getenv("MONITOR_WORKERS", "8"))
+
+
+@dataclass
+class CheckResult:
+    target: str
+    checked_at: str
+    final_url: str | None = None
+    status_code: int | None = None
+    content_sig: str | None = None
+    title: str | None = None
+    discoveries: set[str] = field(default_factory=set)
+    error: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
 
 
 def utc_now() -> str:
@@ -39,31 +89,51 @@ def load_targets(path: str) -> list[str]:
     return targets
 
 
-def normalize_text(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
+def load_targets_if_changed(path: str, cached: tuple[list[str], float]) -> tuple[list[str], float]:
+    mtime = os.stat(path).st_mtime
+    if mtime == cached[1]:
+        return cached
+    return load_targets(path), mtime
+
+
+def normalize_text(soup: BeautifulSoup) -> str:
     text = soup.get_text(" ", strip=True)
     return re.sub(r"\s+", " ", text).lower()
 
 
-def content_signature(html: str) -> str:
-    normalized = normalize_text(html)
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+def content_signature(soup: BeautifulSoup) -> str:
+    normalized = normalize_text(soup)
+    return signature_hash(normalized.encode("utf-8")).hexdigest()
+
 
+def is_onion_host(host: str) -> bool:
+    # Same test as ONION_RE.fullmatch on a lowercased host, without the regex engine
+    return len(host) == 62 and host.endswith(".onion") and ONION_HOST_CHARS.issuperset(host[:56])
 
-def discover_onion_candidates(base_url: str, html: str) -> set[str]:
-    soup = BeautifulSoup(html, "html.parser")
-    found: set[str] = set(ONION_RE.findall(html))
 
+def discover_onion_candidates(base_url: str, html: str, soup: BeautifulSoup) -> set[str]:
+    found: set[str] = {m.group(0).lower() for m in ONION_RE.finditer(html)}
+
+    # Most onion links were already caught by the scan above; anchors add hosts
+    # hidden by entity encoding, and the page's own host via relative links.
+    # The href is searched directly, so no URL needs joining or parsing.
+    base_host = (urlparse(base_url).hostname or "").lower()
+    base_is_onion = is_onion_host(base_host)
     for a in soup.find_all("a", href=True):
-        full = urljoin(base_url, a["href"])
-        host = (urlparse(full).hostname or "").lower()
-        if ONION_RE.fullmatch(host):
-            found.add(host)
+        href = a["href"]
+        match = ONION_RE.search(href)
+        if match:
+            found.add(match.group(0).lower())
+        elif base_is_onion and not ABSOLUTE_HREF_RE.match(href):
+            found.add(base_host)
 
     return {f"http://{host}/" for host in found}
 
 
 def init_db(conn: sqlite3.Connection) -> None:
+    # WAL with synchronous=NORMAL fsyncs at checkpoints rather than every commit
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS checks (
@@ -75,10 +145,17 @@ def init_db(conn: sqlite3.Connection) -> None:
             ok INTEGER NOT NULL,
             error TEXT,
             content_sig TEXT,
-            title TEXT
+            title TEXT,
+            etag TEXT,
+            last_modified TEXT
         )
         """
     )
+    # Databases created before conditional GETs lack the validator columns
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(checks)")}
+    for column in ("etag", "last_modified"):
+        if column not in columns:
+            conn.execute(f"ALTER TABLE checks ADD COLUMN {column} TEXT")
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS discovered_onions (
@@ -90,19 +167,25 @@ def init_db(conn: sqlite3.Connection) -> None:
         )
         """
     )
+    # Covers recently_seen_signature's lookup so it doesn't scan the whole history
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_checks_sig ON checks(content_sig, checked_at DESC, target_url)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_checks_target_time ON checks(target_url, checked_at DESC)"
+    )
     conn.commit()
 
 
 def save_discoveries(conn: sqlite3.Connection, source_url: str, discoveries: Iterable[str]) -> None:
-    for url in discoveries:
-        conn.execute(
-            """
-            INSERT OR IGNORE INTO discovered_onions (discovered_at, source_url, discovered_url)
-            VALUES (?, ?, ?)
-            """,
-            (utc_now(), source_url, url),
-        )
-    conn.commit()
+    discovered_at = utc_now()
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO discovered_onions (discovered_at, source_url, discovered_url)
+        VALUES (?, ?, ?)
+        """,
+        [(discovered_at, source_url, url) for url in discoveries],
+    )
 
 
 def recently_seen_signature(conn: sqlite3.Connection, signature: str, current_target: str) -> list[str]:
@@ -119,6 +202,128 @@ def recently_seen_signature(conn: sqlite3.Connection, signature: str, current_ta
     return [r[0] for r in rows]
 
 
+# (content signature, title, discovered onion URLs)
+PageAnalysis = tuple[str | None, str | None, set[str]]
+_analysis_cache: OrderedDict[bytes, PageAnalysis] = OrderedDict()
+_analysis_lock = threading.Lock()
+
+
+def analyse_page(base_url: str, raw: bytes, html: str) -> PageAnalysis:
+    # Discoveries resolve relative links against base_url, so it is part of the key
+    key = hashlib.blake2b(base_url.encode("utf-8") + b"\0" + raw, digest_size=16).digest()
+    with _analysis_lock:
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+            return cached
+
+    soup = BeautifulSoup(html, HTML_PARSER)
+    title = soup.title
+    analysis = (
+        content_signature(soup) if html else None,
+        title.get_text(strip=True) if title else None,
+        discover_onion_candidates(base_url, html, soup),
+    )
+
+    with _analysis_lock:
+        _analysis_cache[key] = analysis
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return analysis
+
+
+def previous_check(conn: sqlite3.Connection, target: str) -> CheckResult | None:
+    row = conn.execute(
+        """
+        SELECT content_sig, title, etag, last_modified
+        FROM checks
+        WHERE target_url = ? AND ok = 1
+        ORDER BY checked_at DESC
+        LIMIT 1
+        """,
+        (target,),
+    ).fetchone()
+    if row is None:
+        return None
+    return CheckResult(target=target, checked_at="", content_sig=row[0], title=row[1], etag=row[2], last_modified=row[3])
+
+
+def check_target(session: requests.Session, cfg: Config, target: str, previous: CheckResult | None) -> CheckResult:
+    result = CheckResult(target=target, checked_at=utc_now())
+    # Revalidate against the last successful fetch; servers that send no
+    # validators simply never answer 304
+    headers = {}
+    if previous is not None:
+        if previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+    try:
+        with session.get(
+            target, timeout=45, allow_redirects=cfg.follow_redirects, stream=True, headers=headers
+        ) as response:
+            result.final_url = response.url
+            result.status_code = response.status_code
+            result.etag = response.headers.get("ETag")
+            result.last_modified = response.headers.get("Last-Modified")
+            if response.status_code == 304 and previous is not None:
+                # Unchanged: carry the last analysis forward without reading or parsing
+                result.content_sig, result.title = previous.content_sig, previous.title
+                result.etag = result.etag or previous.etag
+                result.last_modified = result.last_modified or previous.last_modified
+                return result
+            raw = response.raw.read(MAX_BODY_BYTES, decode_content=True)
+        try:
+            html = raw.decode(response.encoding or "utf-8", errors="replace")
+        except LookupError:
+            html = raw.decode("utf-8", errors="replace")
+
+        result.content_sig, result.title, result.discoveries = analyse_page(response.url, raw, html)
+    except Exception as exc:  # noqa: BLE001
+        result.error = str(exc)
+    return result
+
+
+def record_result(conn: sqlite3.Connection, result: CheckResult) -> None:
+    checked_at, target = result.checked_at, result.target
+    if result.error is not None:
+        conn.execute(
+            """
+            INSERT INTO checks (checked_at, target_url, final_url, status_code, ok, error, content_sig, title)
+            VALUES (?, ?, NULL, NULL, 0, ?, NULL, NULL)
+            """,
+            (checked_at, target, result.error),
+        )
+        print(f"[{checked_at}] fail {target}: {result.error}")
+        return
+
+    conn.execute(
+        """
+        INSERT INTO checks (
+            checked_at, target_url, final_url, status_code, ok, error, content_sig, title, etag, last_modified
+        )
+        VALUES (?, ?, ?, ?, 1, NULL, ?, ?, ?, ?)
+        """,
+        (
+            checked_at, target, result.final_url, result.status_code, result.content_sig, result.title,
+            result.etag, result.last_modified,
+        ),
+    )
+
+    if result.discoveries:
+        save_discoveries(conn, target, result.discoveries)
+
+    if result.content_sig:
+        mirrors = recently_seen_signature(conn, result.content_sig, target)
+        if mirrors:
+            print(f"[{checked_at}] mirror-like content for {target}: {mirrors}")
+
+    if result.final_url != target:
+        print(f"[{checked_at}] redirect {target} -> {result.final_url}")
+
+    print(f"[{checked_at}] ok {target} ({result.status_code})")
+
+
 def run() -> None:
     cfg = Config()
     session = requests.Session()
@@ -127,56 +332,41 @@ def run() -> None:
         "https": f"socks5h://{cfg.socks_host}:{cfg.socks_port}",
     }
     session.headers.update({"User-Agent": "tor-uptime-monitor/0.1"})
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        # Retry connection setup only: a read timeout means the hidden service
+        # is slow, and retrying it would stretch one sample past the timeout.
+        max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.5),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
 
     conn = sqlite3.connect(cfg.db_path)
     init_db(conn)
+    # Targets are fetched concurrently so one slow onion can't stall the cycle;
+    # results are written here, on the thread that owns the connection.
+    executor = ThreadPoolExecutor(max_workers=cfg.workers)
 
+    next_cycle = time.monotonic()
+    cached_targets: tuple[list[str], float] = ([], -1.0)
     while True:
-        targets = load_targets(cfg.targets_file)
-        for target in targets:
-            checked_at = utc_now()
-            try:
-                response = session.get(target, timeout=45, allow_redirects=cfg.follow_redirects)
-                html = response.text or ""
-                sig = content_signature(html) if html else None
-                title = BeautifulSoup(html, "html.parser").title
-                title_text = title.get_text(strip=True) if title else None
-                final_url = response.url
-
-                conn.execute(
-                    """
-                    INSERT INTO checks (checked_at, target_url, final_url, status_code, ok, error, content_sig, title)
-                    VALUES (?, ?, ?, ?, 1, NULL, ?, ?)
-                    """,
-                    (checked_at, target, final_url, response.status_code, sig, title_text),
-                )
-                conn.commit()
-
-                discoveries = discover_onion_candidates(final_url, html)
-                if discoveries:
-                    save_discoveries(conn, target, discoveries)
-
-                if sig:
-                    mirrors = recently_seen_signature(conn, sig, target)
-                    if mirrors:
-                        print(f"[{checked_at}] mirror-like content for {target}: {mirrors}")
-
-                if final_url != target:
-                    print(f"[{checked_at}] redirect {target} -> {final_url}")
-
-                print(f"[{checked_at}] ok {target} ({response.status_code})")
-            except Exception as exc:  # noqa: BLE001
-                conn.execute(
-                    """
-                    INSERT INTO checks (checked_at, target_url, final_url, status_code, ok, error, content_sig, title)
-                    VALUES (?, ?, NULL, NULL, 0, ?, NULL, NULL)
-                    """,
-                    (checked_at, target, str(exc)),
-                )
-                conn.commit()
-                print(f"[{checked_at}] fail {target}: {exc}")
-
-        time.sleep(cfg.interval_s)
+        cached_targets = load_targets_if_changed(cfg.targets_file, cached_targets)
+        targets = cached_targets[0]
+        futures = [
+            executor.submit(check_target, session, cfg, target, previous_check(conn, target))
+            for target in targets
+        ]
+        # One transaction (and one commit) per cycle instead of one per row
+        with conn:
+            for future in as_completed(futures):
+                record_result(conn, future.result())
+
+        # Cycles start every interval_s rather than interval_s after the last one
+        # finished; an overrunning cycle starts the next one immediately
+        now = time.monotonic()
+        next_cycle = max(next_cycle + cfg.interval_s, now)
+        time.sleep(next_cycle - now)
 
 
 if __name__ == "__main__":